@@ -7,32 +7,96 @@ management and robust error handling.
 
 import logging
 import os
-import tempfile
+import re
+import json
 import time
 import threading
 import subprocess
+import selectors
 import shutil
 import asyncio
 import atexit
-from pathlib import Path
+import concurrent.futures
+import numpy as np
 from typing import Dict, Optional, Tuple, Union, List
 from contextlib import contextmanager
 
+# Try to import piper bindings for in-process synthesis. Only piper-tts 1.2
+# streams raw audio; with other releases the piper executable is used instead
+try:
+    from piper import PiperVoice
+    from piper.config import PiperConfig
+    PIPER_BINDINGS_AVAILABLE = hasattr(PiperVoice, 'synthesize_stream_raw')
+except ImportError:
+    PIPER_BINDINGS_AVAILABLE = False
+
 # Import from Grace modules
 from grace.utils.common import MODELS_PATH
 
+# Sentence boundaries used to pipeline synthesis with playback
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+# Piper reads one utterance per line
+_NEWLINE = b"\n"
+
+# Logged by piper on stderr once all audio for an input line is on stdout.
+# Not every piper logs it (the piper-tts CLI, or the binary with --quiet)
+_PIPER_LINE_DONE = b"Real-time factor"
+
+# For a piper not seen to log line markers, stdout idle this long after audio
+# has started ends the utterance
+_PIPER_IDLE_TIMEOUT = 1.0
+
+# Audio players in order of preference, each with a function building its
+# command line for raw 16-bit mono PCM at a sample rate, read from stdin
+_PLAYER_SPECS = (
+    ("aplay", lambda sr: ("aplay", "-q", "-r", str(sr), "-f", "S16_LE", "-c", "1", "-")),
+    ("paplay", lambda sr: ("paplay", "--raw", "--rate", str(sr), "--format", "s16le", "--channels", "1")),
+    ("play", lambda sr: ("play", "-q", "-r", str(sr), "-b", "16", "-c", "1", "-e", "signed", "-t", "raw", "-")),
+)
+
+
+def _split_sentences(text: str, max_length: int = 200) -> List[str]:
+    """
+    Split text into sentences so synthesis of one overlaps playback of another.
+    
+    Run-on text without sentence punctuation is broken into windows of at most
+    max_length characters, preferring to break on whitespace.
+    
+    Args:
+        text: Text to split
+        max_length: Maximum length of a single piece
+        
+    Returns:
+        List of non-empty sentences
+    """
+    sentences = []
+    for sentence in _SENTENCE_END.split(text.strip()):
+        while len(sentence) > max_length:
+            cut = sentence.rfind(' ', 0, max_length)
+            if cut <= 0:
+                cut = max_length
+            sentences.append(sentence[:cut].strip())
+            sentence = sentence[cut:].strip()
+        if sentence:
+            sentences.append(sentence)
+    return sentences
+
 
 class AudioOutput:
     """
     Audio output system for text-to-speech functionality.
     
     Features:
-    - Text-to-speech using piper with proper resource management
+    - Text-to-speech using piper, in-process when the bindings are installed
     - Multiple fallback mechanisms for robust operation
     - Comprehensive error handling and logging
     - Proper cleanup of resources
     """
     
+    # Set once MODELS_PATH is known to exist
+    _models_path_ready = False
+    
     def __init__(self, config: Dict):
         """
         Initialize the audio output system with the provided configuration.
@@ -46,27 +110,76 @@ class AudioOutput:
         
         # Initialize components with proper resource tracking
         self.piper_process = None
+        self._piper_selector = None
+        self.voice = None
+        
+        # Cached result of polling the piper process, see _piper_alive
+        self._last_poll_time = 0.0
+        self._last_poll_result = False
+        
+        # Whether the running piper has logged a line marker yet
+        self._piper_logs_lines = False
+        
+        self.player_process = None
+        self._silence_pad = b""
+        
+        # Estimated time the audio written so far finishes playing
+        self._bytes_per_second = self.piper_config.get('sample_rate', 22050) * 2
+        self._playback_end = 0.0
+        
+        # Bumped by each shutdown, so a speak that stop() cut short can tell
+        self._shutdowns = 0
+        
+        # Reused for every read from piper instead of allocating per chunk,
+        # typed as samples so volume can be applied in place
+        self._read_buffer = np.empty(2048, dtype=np.int16)
+        
         self.active_processes = set()
         
         # Track failures for better error reporting
         self.last_tts_error = None
         self.model_found = False
         
-        # Lock for thread safety
-        self.piper_lock = threading.RLock()
+        # Resolve external tools once instead of walking PATH per utterance
+        self._piper_bin = shutil.which("piper")
+        self._available_players = [(name, cmd) for name, cmd in _PLAYER_SPECS if shutil.which(name)]
+        self._fallbacks = [name for name in ("espeak", "festival") if shutil.which(name)]
         
-        # Track temp files for cleanup
-        self.temp_files = set()
+        # Last model found by get_piper_model_path
+        self._model_path = None
+        
+        # Piper command line, built once per model
+        self._piper_cmd = None
+        
+        # Locks for thread safety. piper_lock only guards the piper handles;
+        # player_lock is held for a whole utterance, which keeps piper's pipes
+        # single-writer/single-reader so they need no lock of their own
+        self.piper_lock = threading.Lock()
+        self.player_lock = threading.RLock()
+        
+        # Single worker so async utterances run one at a time, in order.
+        # Created on first use, and again if speak_async is called after stop()
+        self._tts_executor = None
         
         # Register cleanup handler
         atexit.register(self._cleanup_all_resources)
         
-        # Create models directory if it doesn't exist
-        MODELS_PATH.mkdir(parents=True, exist_ok=True)
+        # Create models directory if it doesn't exist, once per process
+        if not AudioOutput._models_path_ready:
+            MODELS_PATH.mkdir(parents=True, exist_ok=True)
+            AudioOutput._models_path_ready = True
         
-        # Verify if piper model exists
-        if self.get_piper_model_path():
+        # Preload piper unless muted, so the first utterance doesn't wait for
+        # the model to load; otherwise the search happens on first use
+        muted = self.audio_config.get('mute', False)
+        if self.piper_config.get('preload', not muted) and self.get_piper_model_path():
             self.model_found = True
+            if not muted:
+                threading.Thread(
+                    target=self.start_piper,
+                    name="grace-piper-preload",
+                    daemon=True
+                ).start()
     
     def get_piper_model_path(self):
         """
@@ -75,43 +188,61 @@ class AudioOutput:
         Returns:
             Path to the Piper model file or None if not found
         """
-        # Try the configured path first
-        primary_path = self.piper_config.get('model_path', str(MODELS_PATH / 'cori-high.onnx'))
-        primary_path = Path(primary_path)
-        
-        # Backward compatibility: Handle string paths
-        if isinstance(primary_path, str):
-            primary_path = Path(primary_path)
-        
-        if primary_path.exists():
-            return str(primary_path)
-            
-        # Check alternative model names in the models directory
-        model_candidates = [
-            MODELS_PATH / 'cori-high.onnx',
-            MODELS_PATH / 'en_US-cori-high.onnx',
-            MODELS_PATH / 'en_US-amy-medium.onnx',
-            MODELS_PATH / 'en_US-lessac-medium.onnx',
-            Path('/usr/share/piper/voices/en_US-cori-high.onnx'),
-            Path('/usr/share/piper/voices/en_US-amy-medium.onnx'),
-            Path('/usr/share/piper/voices/en_US-lessac-medium.onnx'),
-            Path('/usr/local/share/piper/voices/en_US-cori-high.onnx')
-        ]
+        # Reuse the last model found while it still exists
+        if self._model_path and os.path.exists(self._model_path):
+            return self._model_path
+            
+        self._model_path = self._find_piper_model()
+        return self._model_path
         
-        for model_path in model_candidates:
-            if model_path.exists():
-                # Update the config with the found model path for future use
-                self.piper_config['model_path'] = str(model_path)
-                return str(model_path)
+    def _find_piper_model(self):
+        """
+        Search the configured path and known locations for a Piper model.
         
-        # Search for any .onnx files in the models directory
+        Returns:
+            Path to the Piper model file or None if not found
+        """
+        # Try the configured path first
+        configured_path = self.piper_config.get('model_path')
+        if configured_path and os.path.isfile(configured_path):
+            return str(configured_path)
+            
+        # One directory read covers every candidate in the models directory
         try:
-            onnx_files = list(MODELS_PATH.glob("*.onnx"))
-            if onnx_files:
-                self.piper_config['model_path'] = str(onnx_files[0])
-                return str(onnx_files[0])
-        except Exception as e:
+            with os.scandir(MODELS_PATH) as entries:
+                local_models = {
+                    entry.name for entry in entries
+                    if entry.name.endswith('.onnx') and entry.is_file()
+                }
+        except OSError as e:
             self.logger.debug(f"Error searching for .onnx files: {e}")
+            local_models = set()
+            
+        # Check preferred model names in the models directory
+        for name in ('cori-high.onnx', 'en_US-cori-high.onnx',
+                     'en_US-amy-medium.onnx', 'en_US-lessac-medium.onnx'):
+            if name in local_models:
+                # Update the config with the found model path for future use
+                self.piper_config['model_path'] = str(MODELS_PATH / name)
+                return self.piper_config['model_path']
+                
+        # Check system-wide voice installs
+        system_candidates = [
+            '/usr/share/piper/voices/en_US-cori-high.onnx',
+            '/usr/share/piper/voices/en_US-amy-medium.onnx',
+            '/usr/share/piper/voices/en_US-lessac-medium.onnx',
+            '/usr/local/share/piper/voices/en_US-cori-high.onnx'
+        ]
+        
+        for model_path in system_candidates:
+            if os.path.isfile(model_path):
+                self.piper_config['model_path'] = model_path
+                return model_path
+        
+        # Fall back to any other .onnx file in the models directory
+        if local_models:
+            self.piper_config['model_path'] = str(MODELS_PATH / sorted(local_models)[0])
+            return self.piper_config['model_path']
                 
         # No model found
         return None
@@ -125,11 +256,11 @@ class AudioOutput:
         """
         with self.piper_lock:
             # Check if already running
-            if self.piper_process and self.piper_process.poll() is None:
+            if self._piper_alive():
                 return True
                 
             # Clean up any previous process
-            self._cleanup_piper()
+            self._release_piper()
                 
             # Get model path with fallback options
             model_path = self.get_piper_model_path()
@@ -140,33 +271,57 @@ class AudioOutput:
                 self.last_tts_error = "Piper model not found"
                 return False
                 
+            self.model_found = True
+                
+            # Prefer synthesizing in-process, avoiding the pipe round-trip
+            if PIPER_BINDINGS_AVAILABLE:
+                try:
+                    self.voice = self._load_piper_voice(model_path)
+                    self.piper_config.setdefault('sample_rate', self.voice.config.sample_rate)
+                    self.logger.info(f"Piper TTS loaded in-process with model {model_path}")
+                    return True
+                except Exception as e:
+                    self.logger.warning(f"Failed to load piper voice in-process, using executable: {e}")
+                    self.voice = None
+                
             # Check if piper executable exists
-            piper_executable = shutil.which("piper")
+            piper_executable = self._piper_bin
             if not piper_executable:
                 self.logger.error("Piper executable not found in PATH")
                 self.last_tts_error = "Piper executable not found"
                 return False
             
-            cmd = [
-                piper_executable,
-                "--model", model_path,
-                "--output_raw",
-                "--length_scale", "1",
-                "--sentence_silence", "0.2"
-            ]
+            if self._piper_cmd is None or self._piper_cmd[2] != model_path:
+                self._piper_cmd = (
+                    piper_executable,
+                    "--model", model_path,
+                    "--output_raw",
+                    "--length_scale", "1",
+                    "--sentence_silence", "0.2"
+                )
             
             try:
                 self.piper_process = subprocess.Popen(
-                    cmd,
+                    self._piper_cmd,
                     stdin=subprocess.PIPE,
                     stdout=subprocess.PIPE,
-                    stderr=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,  # Carries the end-of-line markers
                     bufsize=0,  # Unbuffered for binary mode
                     universal_newlines=False  # Binary mode
                 )
                 
                 # Add to tracked processes
                 self.active_processes.add(self.piper_process)
+                self._last_poll_result = True
+                self._last_poll_time = time.monotonic()
+                self._piper_logs_lines = False
+                
+                # Register stdout and stderr once; reads are non-blocking and
+                # driven by readiness, so a stuck piper can't block a read
+                self._piper_selector = selectors.DefaultSelector()
+                for pipe in (self.piper_process.stdout, self.piper_process.stderr):
+                    os.set_blocking(pipe.fileno(), False)
+                    self._piper_selector.register(pipe, selectors.EVENT_READ)
                 
                 self.logger.info(f"Piper TTS started with model {model_path}")
                 return True
@@ -179,25 +334,97 @@ class AudioOutput:
                 self.last_tts_error = str(e)
                 return False
             
+    def _load_piper_voice(self, model_path: str):
+        """
+        Load a piper voice for in-process synthesis.
+        
+        Args:
+            model_path: Path to the ONNX voice model
+            
+        Returns:
+            Loaded PiperVoice
+        """
+        # Only paid for once a voice is actually loaded
+        import onnxruntime
+        
+        # Voice config lives next to the model, as the piper executable expects
+        with open(f"{model_path}.json", 'r', encoding='utf-8') as f:
+            config = PiperConfig.from_dict(json.load(f))
+            
+        # Leave half the cores for the rest of the assistant
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = max(1, (os.cpu_count() or 2) // 2)
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        
+        session = onnxruntime.InferenceSession(
+            model_path,
+            sess_options=options,
+            providers=["CPUExecutionProvider"]
+        )
+        return PiperVoice(session=session, config=config)
+            
+    def _piper_alive(self) -> bool:
+        """
+        Check whether piper is usable, polling the process at most every 100 ms.
+        
+        Returns:
+            True if the voice is loaded or the piper process is running
+        """
+        if self.voice is not None:
+            return True
+            
+        now = time.monotonic()
+        if now - self._last_poll_time >= 0.1:
+            self._last_poll_result = self.piper_process is not None and self.piper_process.poll() is None
+            self._last_poll_time = now
+        return self._last_poll_result
+            
     def _cleanup_piper(self):
         """Cleanup piper process to avoid resource leaks."""
         with self.piper_lock:
-            if self.piper_process:
+            self._release_piper()
+            
+    def _release_piper(self, wait: bool = True):
+        """
+        Release the piper voice or process. Must be called with piper_lock held.
+        
+        Args:
+            wait: Wait for the process to exit; otherwise it is only signalled
+                and left in active_processes to be reaped by the caller
+        """
+        # The in-process voice only needs its session released
+        self.voice = None
+        
+        # Force the next liveness check to poll
+        self._last_poll_time = 0.0
+        
+        # A speak thread may still be reading through the selector; it
+        # closes the selector itself once it sees piper was released
+        if self._piper_selector:
+            if self.player_lock.acquire(blocking=False):
                 try:
-                    if self.piper_process.poll() is None:
-                        self.piper_process.terminate()
+                    self._piper_selector.close()
+                finally:
+                    self.player_lock.release()
+            self._piper_selector = None
+            
+        if self.piper_process:
+            try:
+                if self.piper_process.poll() is None:
+                    self.piper_process.terminate()
+                    if wait:
                         try:
                             self.piper_process.wait(timeout=2)
                         except subprocess.TimeoutExpired:
                             self.piper_process.kill()
                             self.piper_process.wait()
-                except Exception as e:
-                    self.logger.debug(f"Error cleaning up piper process: {e}")
-                finally:
-                    # Remove from tracked processes if it's there
-                    if self.piper_process in self.active_processes:
-                        self.active_processes.remove(self.piper_process)
-                    self.piper_process = None
+            except Exception as e:
+                self.logger.debug(f"Error cleaning up piper process: {e}")
+            finally:
+                # Remove from tracked processes if it's there
+                if wait:
+                    self.active_processes.discard(self.piper_process)
+                self.piper_process = None
                 
     def speak_fallback(self, text: str) -> bool:
         """
@@ -211,35 +438,33 @@ class AudioOutput:
         """
         try:
             # Check if we have installed espeak or festival
-            espeak_exists = shutil.which("espeak")
-            festival_exists = shutil.which("festival")
+            espeak_exists = "espeak" in self._fallbacks
+            festival_exists = "festival" in self._fallbacks
             
             if not (espeak_exists or festival_exists):
                 self.logger.warning("No TTS fallbacks found (espeak or festival)")
                 self.last_tts_error = "No TTS fallbacks available"
                 return False
             
-            # Create a temporary file for the text
-            with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
-                tmp_path = f.name
-                f.write(text)
-                # Track the temp file for cleanup
-                self.temp_files.add(tmp_path)
-            
-            # Try to use system TTS via espeak or festival
+            # Try to use system TTS via espeak or festival, both reading text
+            # from stdin so no file or shell is involved
             fallback_options = []
             
             if espeak_exists:
-                fallback_options.append(["espeak", "-f", tmp_path])
+                fallback_options.append(["espeak", "--stdin"])
                 
             if festival_exists:
-                fallback_options.append(["bash", "-c", f"cat {tmp_path} | festival --tts"])
+                fallback_options.append(["festival", "--tts"])
                 
+            text_data = text.encode('utf-8')
+            
             for tts_cmd in fallback_options:
+                process = None
                 try:
                     # Run with timeout based on text length
                     process = subprocess.Popen(
                         tts_cmd,
+                        stdin=subprocess.PIPE,
                         stdout=subprocess.DEVNULL,
                         stderr=subprocess.DEVNULL
                     )
@@ -250,48 +475,27 @@ class AudioOutput:
                     # Calculate a reasonable timeout based on text length
                     timeout = min(30, max(5, len(text) * 0.1))
                     
-                    # Wait for process to complete with timeout
+                    # Send the text and wait for process to complete with timeout
                     try:
-                        process.wait(timeout=timeout)
+                        process.communicate(text_data, timeout=timeout)
                     except subprocess.TimeoutExpired:
                         # Kill if it takes too long
                         process.kill()
                         process.wait()
                     
-                    # Clean up temp file
-                    try:
-                        os.unlink(tmp_path)
-                        self.temp_files.remove(tmp_path)
-                    except Exception:
-                        pass
-                    
-                    # Remove from tracked processes
-                    if process in self.active_processes:
-                        self.active_processes.remove(process)
-                    
                     if process.returncode == 0:
                         self.logger.info(f"Used fallback TTS: {tts_cmd[0]}")
                         return True
                     
-                except (subprocess.SubprocessError, FileNotFoundError):
-                    # Remove from tracked processes if it's there
-                    if process in self.active_processes:
-                        self.active_processes.remove(process)
+                except (subprocess.SubprocessError, OSError):
                     continue
+                finally:
+                    # Remove from tracked processes
+                    self.active_processes.discard(process)
                     
             # If all fallbacks failed
             self.logger.warning("All TTS fallbacks failed")
             self.last_tts_error = "All TTS fallbacks failed"
-            
-            # Clean up temp file if it still exists
-            try:
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
-                    if tmp_path in self.temp_files:
-                        self.temp_files.remove(tmp_path)
-            except Exception:
-                pass
-                
             return False
             
         except Exception as e:
@@ -317,179 +521,375 @@ class AudioOutput:
             self.logger.info("TTS is muted")
             return True
             
+        # A shutdown after this point means stop() cut the utterance short
+        shutdowns = self._shutdowns
+        
         # Start piper if not running
         if not self.start_piper():
             self.logger.warning("Failed to start piper, trying fallback TTS")
             return self.speak_fallback(text)
             
-        # Create a temp file for the audio data
-        tmp_path = None
-        
         try:
-            # Make sure we can access piper_process safely
-            with self.piper_lock:
-                if not self.piper_process or self.piper_process.poll() is not None:
-                    self.logger.warning("Piper process not available, restarting")
-                    if not self.start_piper():
+            # Hold the player for the whole utterance so utterances don't interleave
+            with self.player_lock:
+                # Reuse the running player, only paying its startup cost once
+                if self.player_process is None or self.player_process.poll() is not None:
+                    if not self._start_player():
+                        self.logger.warning("No audio player available, trying fallback")
                         return self.speak_fallback(text)
                 
-                # Send text to piper with proper encoding and termination
-                self.piper_process.stdin.write((text + "\n").encode('utf-8'))
-                self.piper_process.stdin.flush()
-            
-            # Read raw audio output with timeout handling
-            audio_data = bytearray()
-            start_time = time.time()
-            
-            # Use a separate thread to read data to avoid blocking
-            read_complete = threading.Event()
-            
-            def read_output():
-                nonlocal audio_data
-                try:
-                    with self.piper_lock:
-                        if not self.piper_process or self.piper_process.poll() is not None:
-                            read_complete.set()
-                            return
-                            
-                        while time.time() - start_time < 30:  # 30 second absolute timeout
-                            chunk = self.piper_process.stdout.read(4096)
-                            if not chunk:
-                                break
-                            audio_data.extend(chunk)
-                            # Add reasonable size limit to avoid memory issues
-                            if len(audio_data) > 10 * 1024 * 1024:  # 10MB limit
-                                break
-                except Exception as e:
-                    self.logger.debug(f"Error reading audio data: {e}")
-                finally:
-                    read_complete.set()
-            
-            # Start reading thread
-            read_thread = threading.Thread(target=read_output)
-            read_thread.daemon = True
-            read_thread.start()
-            
-            # Wait for thread with timeout
-            read_complete.wait(timeout=10)  # 10 second timeout for reading
-            
-            if audio_data:
-                # Use a temp file to avoid issues with large audio data
-                with tempfile.NamedTemporaryFile(suffix='.raw', delete=False) as tmp:
-                    tmp_path = tmp.name
-                    tmp.write(audio_data)
-                    # Track the temp file for cleanup
-                    self.temp_files.add(tmp_path)
-                
-                # Check for alternative audio players
-                player_commands = []
+                # Stream raw audio straight into the player as piper produces it
+                received, player_ok = self._stream_piper_output(text, self.player_process)
                 
-                # Linux audio players
-                if shutil.which("aplay"):
-                    player_commands.append([
-                        "aplay", 
-                        "-r", str(self.piper_config.get('sample_rate', 22050)), 
-                        "-f", "S16_LE", 
-                        "-c", "1", 
-                        tmp_path
-                    ])
-                
-                if shutil.which("play"):
-                    player_commands.append([
-                        "play",
-                        "-r", str(self.piper_config.get('sample_rate', 22050)),
-                        "-b", "16",
-                        "-c", "1",
-                        "-e", "signed",
-                        "-t", "raw",
-                        tmp_path
-                    ])
-                    
-                if shutil.which("paplay"):
-                    player_commands.append([
-                        "paplay",
-                        "--rate", str(self.piper_config.get('sample_rate', 22050)),
-                        "--format", "s16le",
-                        "--channels", "1",
-                        tmp_path
-                    ])
-                    
-                # Try each player in order
-                success = False
-                for play_cmd in player_commands:
+                # Pad with silence so consecutive utterances don't run together
+                if received and player_ok:
                     try:
-                        self.logger.debug(f"Trying audio player: {play_cmd[0]}")
-                        
-                        process = subprocess.Popen(
-                            play_cmd,
-                            stdout=subprocess.DEVNULL,
-                            stderr=subprocess.DEVNULL
-                        )
-                        
-                        # Add to tracked processes
-                        self.active_processes.add(process)
-                        
-                        # Calculate a reasonable timeout based on text length
-                        timeout = min(30, max(5, len(text) * 0.1))
-                        
-                        # Wait for process to complete with timeout
-                        try:
-                            process.wait(timeout=timeout)
-                        except subprocess.TimeoutExpired:
-                            # Kill if it takes too long
-                            process.kill()
-                            process.wait()
-                        
-                        # Remove from tracked processes
-                        if process in self.active_processes:
-                            self.active_processes.remove(process)
+                        self._write_to_player(self.player_process, self._silence_pad)
+                    except (BrokenPipeError, OSError):
+                        player_ok = False
                         
-                        if process.returncode == 0:
-                            success = True
-                            break
-                    except Exception as e:
-                        self.logger.debug(f"Error with player {play_cmd[0]}: {e}")
-                        # Remove from tracked processes if it's there
-                        if process in self.active_processes:
-                            self.active_processes.remove(process)
-                        continue
-                
-                # Clean up temp file
-                try:
-                    os.unlink(tmp_path)
-                    if tmp_path in self.temp_files:
-                        self.temp_files.remove(tmp_path)
-                except Exception:
-                    pass
+                # A player that stopped accepting audio is restarted on next use
+                if not player_ok:
+                    self._cleanup_player()
                     
-                if success:
-                    return True
-                
-                self.logger.warning("All audio players failed")
-                
-            else:
+            # Don't wait for or replace speech that is being shut down
+            if self._shutdowns != shutdowns:
+                return False
+            
+            if not received:
                 self.logger.warning("No audio data received from piper")
+            elif player_ok:
+                # Return only once the reply has been heard, so callers that
+                # start listening next don't record its tail
+                remaining = self._playback_end - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
+                return True
+            else:
+                self.logger.warning("Audio player failed")
             
             # If piper fails, try the fallback
             self.logger.warning("Piper TTS failed, trying fallback")
             return self.speak_fallback(text)
             
         except Exception as e:
+            # Errors from piper being released under us are part of shutdown
+            if self._shutdowns != shutdowns:
+                return False
+                
             self.logger.error(f"TTS error: {e}")
             self.last_tts_error = str(e)
             
-            # Clean up temp file if it exists
-            if tmp_path:
-                try:
-                    os.unlink(tmp_path)
-                    if tmp_path in self.temp_files:
-                        self.temp_files.remove(tmp_path)
-                except Exception:
-                    pass
+            # Don't trust a cached liveness check after a failure
+            self._last_poll_time = 0.0
                     
             # Try fallback if piper fails
             return self.speak_fallback(text)
     
+    def _start_player(self) -> bool:
+        """
+        Start a long-running audio player that reads raw PCM from stdin.
+        
+        Returns:
+            Success status
+        """
+        with self.player_lock:
+            # Check if already running
+            if self.player_process and self.player_process.poll() is None:
+                return True
+                
+            # Clean up any previous process
+            self._cleanup_player()
+            
+            sample_rate = self.piper_config.get('sample_rate', 22050)
+            
+            for name, player_cmd in self._available_players:
+                try:
+                    self.logger.debug(f"Trying audio player: {name}")
+                    
+                    self.player_process = subprocess.Popen(
+                        player_cmd(sample_rate),
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL
+                    )
+                    
+                    # Add to tracked processes
+                    self.active_processes.add(self.player_process)
+                    
+                    # 200 ms of 16-bit mono silence written after each utterance
+                    self._silence_pad = b"\x00" * (sample_rate * 2 // 5)
+                    self._bytes_per_second = sample_rate * 2
+                    
+                    self.logger.info(f"Audio player started: {name}")
+                    return True
+                except Exception as e:
+                    self.logger.debug(f"Error with player {name}: {e}")
+                    continue
+                    
+            self.last_tts_error = "No audio player available"
+            return False
+            
+    def _cleanup_player(self, wait: bool = True):
+        """
+        Cleanup the audio player process to avoid resource leaks.
+        
+        Args:
+            wait: Wait for the player to exit; otherwise it is only asked to
+                finish and left in active_processes to be reaped by the caller
+        """
+        with self.player_lock:
+            if self.player_process:
+                try:
+                    if self.player_process.poll() is None:
+                        # Closing stdin lets the player finish buffered audio
+                        try:
+                            self.player_process.stdin.close()
+                            if wait:
+                                self.player_process.wait(timeout=2)
+                        except (subprocess.TimeoutExpired, OSError):
+                            self.player_process.terminate()
+                            try:
+                                self.player_process.wait(timeout=2)
+                            except subprocess.TimeoutExpired:
+                                self.player_process.kill()
+                                self.player_process.wait()
+                except Exception as e:
+                    self.logger.debug(f"Error cleaning up audio player: {e}")
+                finally:
+                    # Remove from tracked processes if it's there
+                    if wait:
+                        self.active_processes.discard(self.player_process)
+                    self.player_process = None
+    
+    def _synthesize(self, text: str):
+        """
+        Generate raw 16-bit mono PCM for text as it is synthesized.
+        
+        Piper keeps stdout open between utterances, so for the piper process
+        the end of each queued sentence is taken from the line piper logs on
+        stderr after writing that sentence's audio. A piper that has not
+        logged such a line is instead followed until stdout goes idle for
+        _PIPER_IDLE_TIMEOUT once audio has started. Must be called with
+        player_lock held, which makes the caller the only writer of piper's
+        stdin and the only reader of its output.
+        
+        Args:
+            text: Text to synthesize
+            
+        Yields:
+            Chunks of raw audio
+        """
+        # Only the handles need the lock; the pipes are used without it
+        with self.piper_lock:
+            voice = self.voice
+            process = self.piper_process
+            selector = self._piper_selector
+            
+        if voice is None and process is None:
+            self.logger.warning("Piper is not running")
+            return
+            
+        sentences = _split_sentences(text)
+        
+        # Optional attenuation, clamped so scaled samples can't overflow
+        gain = min(1.0, max(0.0, float(self.audio_config.get('volume', 1.0))))
+        
+        if voice is not None:
+            for sentence in sentences:
+                if self.voice is not voice:
+                    # Released by stop() mid-utterance
+                    return
+                for chunk in voice.synthesize_stream_raw(
+                    sentence,
+                    length_scale=1,
+                    sentence_silence=0.2
+                ):
+                    if gain != 1.0:
+                        samples = np.frombuffer(chunk, dtype=np.int16).copy()
+                        np.multiply(samples, gain, out=samples, casting='unsafe')
+                        chunk = memoryview(samples).cast('B')
+                    yield chunk
+            return
+            
+        try:
+            # Discard output left over from an utterance that was cut short
+            self._drain_piper(process)
+            
+            # Queue every sentence up front, one per line, so piper synthesizes
+            # the next sentence while the current one is playing
+            lines = [sentence.encode('utf-8') for sentence in sentences]
+            lines.append(b"")
+            process.stdin.write(_NEWLINE.join(lines))
+            process.stdin.flush()
+            
+            stdout = process.stdout
+            read_view = memoryview(self._read_buffer).cast('B')
+            
+            # Bytes of an incomplete sample carried over to the next read
+            pending = 0
+            
+            lines_left = len(sentences)
+            log_tail = b""
+            audio_started = False
+            
+            while True:
+                if self.piper_process is not process:
+                    # Released by stop() mid-utterance
+                    return
+                    
+                if lines_left:
+                    # Without line markers the end can only be told from
+                    # stdout going idle once audio has started
+                    idle_ends = audio_started and not self._piper_logs_lines
+                    events = selector.select(_PIPER_IDLE_TIMEOUT if idle_ends else 10)
+                    if not events:
+                        if not idle_ends:
+                            # No output at all for this long means piper is stuck
+                            self.logger.warning(f"Piper stopped responding with {lines_left} sentences left")
+                        return
+                    ready = [key.fileobj for key, _ in events]
+                else:
+                    # Audio for the last sentence is already in the pipe once it is logged
+                    ready = [stdout]
+                
+                for pipe in ready:
+                    if pipe is process.stderr:
+                        log = pipe.read(4096)
+                        if log is None:
+                            continue
+                        if not log:
+                            # Piper exited
+                            return
+                        
+                        # Count completed lines, keeping a partial log line for later
+                        *complete, log_tail = (log_tail + log).split(_NEWLINE)
+                        done = sum(_PIPER_LINE_DONE in line for line in complete)
+                        if done:
+                            self._piper_logs_lines = True
+                            lines_left -= done
+                        continue
+                    
+                    # Each chunk is consumed before the buffer is refilled
+                    nbytes = stdout.readinto(read_view[pending:])
+                    if nbytes is None:
+                        if not lines_left:
+                            # Everything piper wrote for this utterance has been read
+                            return
+                        # Spurious wakeup, nothing to read yet
+                        continue
+                    if not nbytes:
+                        # Piper exited
+                        return
+                    
+                    # Only hand out whole samples so they stay aligned across reads
+                    total = pending + nbytes
+                    whole = total & ~1
+                    if whole:
+                        if gain != 1.0:
+                            samples = self._read_buffer[:whole // 2]
+                            np.multiply(samples, gain, out=samples, casting='unsafe')
+                        audio_started = True
+                        yield read_view[:whole]
+                    
+                    pending = total - whole
+                    if pending:
+                        read_view[0] = read_view[whole]
+        finally:
+            # A release during the utterance left the selector for us to close
+            if self._piper_selector is not selector:
+                selector.close()
+    
+    def _drain_piper(self, process):
+        """
+        Discard anything piper has already written to stdout or stderr.
+        
+        Args:
+            process: Piper process with non-blocking stdout and stderr
+        """
+        for pipe in (process.stdout, process.stderr):
+            try:
+                while pipe.read(4096):
+                    pass
+            except OSError as e:
+                self.logger.debug(f"Error draining piper output: {e}")
+    
+    def _progressive_chunks(self, chunks):
+        """
+        Re-slice the start of an audio stream into 20, 40, 80 and 160 ms pieces.
+        
+        Small leading writes let the player start as soon as the first frames
+        exist; later chunks are passed through unchanged.
+        
+        Args:
+            chunks: Iterable of raw 16-bit mono PCM chunks
+            
+        Yields:
+            Chunks of raw audio
+        """
+        sample_rate = self.piper_config.get('sample_rate', 22050)
+        schedule = [sample_rate * ms // 500 for ms in (20, 40, 80, 160)]
+        
+        for chunk in chunks:
+            view = memoryview(chunk)
+            while schedule and len(view) > schedule[0]:
+                size = schedule.pop(0)
+                yield view[:size]
+                view = view[size:]
+            if view:
+                yield view
+    
+    def _write_to_player(self, player, data):
+        """
+        Write PCM to the player and extend the estimated end of playback.
+        
+        Must be called with player_lock held.
+        
+        Args:
+            player: Player process reading PCM from stdin
+            data: Raw 16-bit mono PCM
+        """
+        player.stdin.write(data)
+        player.stdin.flush()
+        
+        # Audio queued behind earlier writes plays once they have finished
+        start = max(self._playback_end, time.monotonic())
+        self._playback_end = start + len(data) / self._bytes_per_second
+    
+    def _stream_piper_output(self, text: str, player) -> Tuple[int, bool]:
+        """
+        Synthesize text and forward the audio to a player as it is produced.
+        
+        Must be called with player_lock held.
+        
+        Args:
+            text: Text to speak
+            player: Player process reading PCM from stdin
+            
+        Returns:
+            Tuple of (bytes synthesized, whether the player accepted them all)
+        """
+        received = 0
+        player_ok = True
+        
+        for chunk in self._progressive_chunks(self._synthesize(text)):
+            received += len(chunk)
+            
+            if not player_ok:
+                # Keep draining the piper process so the next utterance
+                # doesn't start with stale audio
+                if self.voice is not None:
+                    break
+                continue
+                
+            try:
+                self._write_to_player(player, chunk)
+            except (BrokenPipeError, OSError) as e:
+                self.logger.debug(f"Error writing to audio player: {e}")
+                player_ok = False
+            
+        return received, player_ok
+    
     async def speak_async(self, text: str) -> bool:
         """
         Convert text to speech asynchronously.
@@ -500,9 +900,23 @@ class AudioOutput:
         Returns:
             Success status
         """
-        # Run TTS in the thread pool
+        # Muted speech needs no thread, matching speak's result
+        if self.audio_config.get('mute', False):
+            return bool(text)
+            
+        # Run TTS on the dedicated worker thread. The piper and player
+        # processes are kept alive across calls from both sync and async
+        # callers, so they can't be bound to a single event loop with asyncio
+        # subprocesses; writing to the player also blocks at playback speed,
+        # which would stall the loop.
+        if self._tts_executor is None:
+            self._tts_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="grace-tts"
+            )
+            
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self.speak, text)
+        return await loop.run_in_executor(self._tts_executor, self.speak, text)
         
     def get_status(self) -> Dict:
         """
@@ -516,19 +930,29 @@ class AudioOutput:
             "last_tts_error": self.last_tts_error,
             "mute": self.audio_config.get('mute', False),
             "model_found": self.model_found,
-            "active_processes": len(self.active_processes),
-            "temp_files": len(self.temp_files)
+            "active_processes": len(self.active_processes)
         }
         
+        # Check if piper is loaded in-process
+        status["piper_in_process"] = self.voice is not None
+        
         # Check if piper process is running
         if self.piper_process:
             try:
                 status["piper_process_running"] = self.piper_process.poll() is None
             except Exception:
                 pass
+                
+        # Check if the audio player is running
+        status["player_process_running"] = False
+        if self.player_process:
+            try:
+                status["player_process_running"] = self.player_process.poll() is None
+            except Exception:
+                pass
             
-        # Get piper model info if available
-        piper_model = self.get_piper_model_path()
+        # Get piper model info if available, searching only if not found yet
+        piper_model = self._model_path or self.get_piper_model_path()
         if piper_model:
             status["piper_model"] = piper_model
             status["model_found"] = True
@@ -536,62 +960,57 @@ class AudioOutput:
             status["piper_model"] = "Not found"
             status["model_found"] = False
             
-        # Check available audio players
-        audio_players = []
-        if shutil.which("aplay"):
-            audio_players.append("aplay")
-        if shutil.which("play"):
-            audio_players.append("play")
-        if shutil.which("paplay"):
-            audio_players.append("paplay")
-        
-        status["available_players"] = audio_players
-        
-        # Check fallback TTS options
-        fallbacks = []
-        if shutil.which("espeak"):
-            fallbacks.append("espeak")
-        if shutil.which("festival"):
-            fallbacks.append("festival")
-            
-        status["available_fallbacks"] = fallbacks
+        # Available audio players and fallback TTS options
+        status["available_players"] = [name for name, _ in self._available_players]
+        status["available_fallbacks"] = list(self._fallbacks)
             
         return status
     
-    def _cleanup_temp_files(self):
-        """Clean up any temporary files created."""
-        for tmp_file in list(self.temp_files):
-            try:
-                if os.path.exists(tmp_file):
-                    os.unlink(tmp_file)
-            except Exception as e:
-                self.logger.debug(f"Error cleaning up temp file {tmp_file}: {e}")
-            finally:
-                self.temp_files.discard(tmp_file)
-    
     def _cleanup_all_resources(self):
         """Clean up all resources during shutdown."""
-        # Clean up piper
-        self._cleanup_piper()
+        self._shutdowns += 1
         
-        # Clean up any active processes
+        # Drop queued utterances; one already playing finishes below
+        executor, self._tts_executor = self._tts_executor, None
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        # Signal piper and the audio player without waiting; the player is
+        # only asked to finish its buffered audio
+        with self.piper_lock:
+            self._release_piper(wait=False)
+        with self.player_lock:
+            player = self.player_process
+            self._cleanup_player(wait=False)
+        
+        # Signal all remaining processes at once so their exits overlap
+        pending = []
         for process in list(self.active_processes):
             try:
                 if process.poll() is None:
-                    process.terminate()
-                    try:
-                        process.wait(timeout=1)
-                    except subprocess.TimeoutExpired:
-                        process.kill()
-                        process.wait()
+                    if process is not player:
+                        process.terminate()
+                    pending.append(process)
             except Exception as e:
                 self.logger.debug(f"Error cleaning up process: {e}")
+                
+        # Reap them, including the draining player, within a single shared
+        # 1 second window
+        deadline = time.monotonic() + 1.0
+        while pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+            pending = [process for process in pending if process.poll() is None]
+            
+        # Kill whatever is still running
+        for process in pending:
+            try:
+                process.kill()
+                process.wait()
+            except Exception as e:
+                self.logger.debug(f"Error killing process: {e}")
         
         # Clear the process list
         self.active_processes.clear()
-        
-        # Clean up temp files
-        self._cleanup_temp_files()
             
     def stop(self):
         """Stop audio services and clean up resources."""
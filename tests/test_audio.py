@@ -3,6 +3,7 @@
 
 import os
 import sys
+import time
 import asyncio
 import tempfile
 import numpy as np
@@ -77,6 +78,59 @@ class AudioTest(BaseTest):
             self.logger.error(f"Failed to create test audio file: {e}")
             return None
     
+    def create_fake_piper(self, directory, log_lines=True, delay=0.0):
+        """Create a stand-in piper executable writing 100 samples per character."""
+        path = os.path.join(directory, 'piper')
+        with open(path, 'w') as f:
+            f.write(f"#!{sys.executable}\n")
+            f.write(
+                "import sys, time\n"
+                "for line in sys.stdin:\n"
+                "    line = line.strip()\n"
+                "    if not line:\n"
+                "        continue\n"
+                f"    time.sleep({delay})\n"
+                "    sys.stdout.buffer.write(b'\\x01\\x00' * (len(line) * 100))\n"
+                "    sys.stdout.buffer.flush()\n"
+                f"    if {log_lines}:\n"
+                "        sys.stderr.write('[piper] [info] Real-time factor: 0.1\\n')\n"
+                "        sys.stderr.flush()\n"
+            )
+        os.chmod(path, 0o755)
+        
+        # The model only has to exist for piper to be started
+        model_path = os.path.join(directory, 'voice.onnx')
+        Path(model_path).touch()
+        return path, model_path
+    
+    def create_fake_audio_output(self, directory, delay=0.0):
+        """Create an unmuted AudioOutput using a stand-in piper and audio player."""
+        from grace.audio.audio_output import AudioOutput
+        
+        piper_path, model_path = self.create_fake_piper(directory, delay=delay)
+        
+        config = self.test_config.copy()
+        config['audio'] = self.test_config['audio'].copy()
+        config['audio']['mute'] = False
+        config['piper'] = {'model_path': model_path, 'preload': False}
+        
+        audio_output = AudioOutput(config)
+        audio_output._piper_bin = piper_path
+        audio_output._fallbacks = []
+        
+        # The player appends everything it is sent to a file
+        played_path = os.path.join(directory, 'played.raw')
+        player_script = (
+            "import sys\n"
+            "with open(sys.argv[1], 'ab') as f:\n"
+            "    for chunk in iter(lambda: sys.stdin.buffer.read1(65536), b''):\n"
+            "        f.write(chunk)\n"
+        )
+        audio_output._available_players = [
+            ("fake", lambda sample_rate: (sys.executable, "-c", player_script, played_path))
+        ]
+        return audio_output, played_path
+    
     def test_audio_utils(self):
         """Test audio utility functions."""
         from grace.audio.audio_utils import normalize_audio, trim_silence, detect_silence
@@ -266,6 +320,361 @@ class AudioTest(BaseTest):
         # Test cleanup
         audio_output.stop()
     
+    def test_split_sentences(self):
+        """Test splitting text into sentences for streaming synthesis."""
+        from grace.audio.audio_output import _split_sentences
+        
+        # Split after sentence punctuation
+        sentences = _split_sentences("Hello there. How are you? Fine!  Thanks.")
+        assert sentences == ["Hello there.", "How are you?", "Fine!", "Thanks."], \
+            f"Unexpected sentence split: {sentences}"
+        
+        # Run-on text is broken into windows of at most 200 characters on whitespace
+        run_on = " ".join(["word"] * 100)
+        pieces = _split_sentences(run_on)
+        assert len(pieces) > 1, "Long text should be split into several pieces"
+        assert all(len(piece) <= 200 for piece in pieces), "Pieces should be at most 200 characters"
+        assert " ".join(pieces) == run_on, "Splitting should not lose any words"
+        
+        # Text without whitespace is cut hard at the window size
+        pieces = _split_sentences("x" * 450)
+        assert [len(piece) for piece in pieces] == [200, 200, 50], \
+            f"Unexpected window sizes: {[len(piece) for piece in pieces]}"
+        
+        # Whitespace-only input produces nothing to speak
+        assert _split_sentences("   \n\t ") == [], "Whitespace-only text should produce no sentences"
+    
+    def test_progressive_chunks(self):
+        """Test the small leading chunks written to the player."""
+        from grace.audio.audio_output import AudioOutput
+        
+        audio_output = AudioOutput(self.test_config)
+        
+        try:
+            # 20, 40, 80 and 160 ms of 16-bit mono audio at 22050 Hz, then the rest
+            chunks = list(audio_output._progressive_chunks([bytes(20000), bytes(3000)]))
+            sizes = [len(chunk) for chunk in chunks]
+            assert sizes == [882, 1764, 3528, 7056, 6770, 3000], f"Unexpected chunk sizes: {sizes}"
+            
+            # Small chunks are passed through as they are
+            chunks = list(audio_output._progressive_chunks([bytes(500), bytes(500)]))
+            sizes = [len(chunk) for chunk in chunks]
+            assert sizes == [500, 500], f"Unexpected chunk sizes: {sizes}"
+        finally:
+            audio_output.stop()
+    
+    def test_find_piper_model(self):
+        """Test the order in which piper models are searched for."""
+        import grace.audio.audio_output as audio_output_module
+        from grace.audio.audio_output import AudioOutput
+        
+        # System-wide voices take precedence over unknown local models
+        system_voices = any(
+            os.path.isfile(os.path.join(directory, 'en_US-cori-high.onnx'))
+            for directory in ('/usr/share/piper/voices', '/usr/local/share/piper/voices')
+        )
+        
+        config = self.test_config.copy()
+        config['piper'] = {'model_path': None}
+        audio_output = AudioOutput(config)
+        
+        original_models_path = audio_output_module.MODELS_PATH
+        with tempfile.TemporaryDirectory() as models_dir:
+            audio_output_module.MODELS_PATH = Path(models_dir)
+            try:
+                # Nothing to find in an empty models directory
+                if not system_voices:
+                    assert audio_output._find_piper_model() is None, "No model should be found"
+                
+                # Any local model is used as a last resort, in name order
+                for name in ('zeta.onnx', 'alpha.onnx', 'notes.txt'):
+                    Path(models_dir, name).touch()
+                if not system_voices:
+                    config['piper']['model_path'] = None
+                    found = audio_output._find_piper_model()
+                    assert found == os.path.join(models_dir, 'alpha.onnx'), f"Unexpected model: {found}"
+                
+                # Preferred names win over other local models
+                Path(models_dir, 'en_US-amy-medium.onnx').touch()
+                config['piper']['model_path'] = None
+                found = audio_output._find_piper_model()
+                assert found == os.path.join(models_dir, 'en_US-amy-medium.onnx'), f"Unexpected model: {found}"
+                
+                Path(models_dir, 'cori-high.onnx').touch()
+                config['piper']['model_path'] = None
+                found = audio_output._find_piper_model()
+                assert found == os.path.join(models_dir, 'cori-high.onnx'), f"Unexpected model: {found}"
+                
+                # An existing configured path is always used first
+                configured = os.path.join(models_dir, 'zeta.onnx')
+                config['piper']['model_path'] = configured
+                found = audio_output._find_piper_model()
+                assert found == configured, f"Configured model should be used first, got {found}"
+                
+                # A missing configured path falls through to the search
+                config['piper']['model_path'] = os.path.join(models_dir, 'missing.onnx')
+                found = audio_output._find_piper_model()
+                assert found == os.path.join(models_dir, 'cori-high.onnx'), f"Unexpected model: {found}"
+            finally:
+                audio_output_module.MODELS_PATH = original_models_path
+                audio_output.stop()
+    
+    def test_process_cleanup_batched(self):
+        """Test that stubborn processes are stopped within one shared window."""
+        from grace.audio.audio_output import AudioOutput
+        
+        audio_output = AudioOutput(self.test_config)
+        
+        # Processes that ignore SIGTERM and have to be killed
+        stubborn = [
+            subprocess.Popen([
+                sys.executable, "-c",
+                "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); time.sleep(60)"
+            ])
+            for _ in range(4)
+        ]
+        # Processes that exit on SIGTERM
+        polite = [
+            subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+            for _ in range(2)
+        ]
+        processes = stubborn + polite
+        audio_output.active_processes.update(processes)
+        
+        # Give the interpreters time to install their signal handlers
+        time.sleep(0.5)
+        
+        try:
+            start = time.monotonic()
+            audio_output.stop()
+            elapsed = time.monotonic() - start
+            
+            # Sequential waits would take at least a second per stubborn process
+            assert elapsed < 2.0, f"Cleanup took {elapsed:.2f}s, processes were not stopped together"
+            assert all(process.poll() is not None for process in processes), "All processes should be stopped"
+            assert not audio_output.active_processes, "Tracked processes should be cleared"
+        finally:
+            for process in processes:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+    
+    def test_volume_clamping(self):
+        """Test that the configured volume is clamped to 0..1 before scaling."""
+        from grace.audio.audio_output import AudioOutput
+        
+        class FakeVoice:
+            """Stands in for an in-process piper voice."""
+            def synthesize_stream_raw(self, sentence, **kwargs):
+                yield np.full(100, 1000, dtype=np.int16).tobytes()
+        
+        config = self.test_config.copy()
+        config['audio'] = self.test_config['audio'].copy()
+        audio_output = AudioOutput(config)
+        audio_output.voice = FakeVoice()
+        
+        try:
+            for volume, expected in ((1.0, 1000), (0.5, 500), (2.0, 1000), (-1.0, 0)):
+                config['audio']['volume'] = volume
+                data = b"".join(bytes(chunk) for chunk in audio_output._synthesize("Hello."))
+                samples = np.frombuffer(data, dtype=np.int16)
+                assert len(samples) == 100, f"Volume {volume} should not change the sample count"
+                assert np.all(samples == expected), \
+                    f"Volume {volume} should scale samples to {expected}, got {samples[0]}"
+        finally:
+            audio_output.voice = None
+            audio_output.stop()
+    
+    def test_piper_line_markers(self):
+        """Test that utterances from a piper process end on its line markers."""
+        from grace.audio.audio_output import AudioOutput
+        
+        text = "First sentence. Second one!"
+        expected_bytes = len("First sentence.Second one!") * 200
+        
+        for log_lines, delay in ((True, 1.2), (False, 0.1)):
+            with tempfile.TemporaryDirectory() as fake_dir:
+                piper_path, model_path = self.create_fake_piper(fake_dir, log_lines, delay)
+                
+                config = self.test_config.copy()
+                config['audio'] = self.test_config['audio'].copy()
+                config['audio']['mute'] = False
+                config['piper'] = {'model_path': model_path, 'preload': False}
+                
+                audio_output = AudioOutput(config)
+                audio_output._piper_bin = piper_path
+                
+                try:
+                    assert audio_output.start_piper(), "Fake piper should start"
+                    
+                    start = time.monotonic()
+                    with audio_output.player_lock:
+                        data = b"".join(bytes(chunk) for chunk in audio_output._synthesize(text))
+                    elapsed = time.monotonic() - start
+                    
+                    # With markers, pauses longer than the idle timeout don't end the utterance
+                    assert len(data) == expected_bytes, \
+                        f"Expected {expected_bytes} bytes with log_lines={log_lines}, got {len(data)}"
+                    
+                    # Without markers, idle stdout ends it well before the 10 second stall timeout
+                    assert elapsed < 5.0, f"Utterance took {elapsed:.2f}s with log_lines={log_lines}"
+                    
+                    # A second utterance doesn't pick up audio from the first
+                    with audio_output.player_lock:
+                        data = b"".join(bytes(chunk) for chunk in audio_output._synthesize("Again."))
+                    assert len(data) == len("Again.") * 200, f"Unexpected second utterance size: {len(data)}"
+                finally:
+                    audio_output.stop()
+    
+    def test_persistent_player(self):
+        """Test that one player process is reused and each utterance is padded."""
+        with tempfile.TemporaryDirectory() as fake_dir:
+            audio_output, played_path = self.create_fake_audio_output(fake_dir)
+            
+            # 200 ms of silence at 22050 Hz after each utterance
+            pad = 22050 * 2 // 5
+            
+            try:
+                # speak returns only once the audio has had time to play
+                start = time.monotonic()
+                assert audio_output.speak("Hello."), "First utterance should be spoken"
+                elapsed = time.monotonic() - start
+                duration = (len("Hello.") * 200 + pad) / (22050 * 2)
+                assert elapsed >= duration, f"speak returned after {elapsed:.2f}s, before {duration:.2f}s of audio played"
+                
+                player = audio_output.player_process
+                assert player is not None and player.poll() is None, "Player should keep running"
+                
+                assert audio_output.speak("Again."), "Second utterance should be spoken"
+                assert audio_output.player_process is player, "Player should be reused across utterances"
+            finally:
+                # Stopping lets the player finish writing what it was sent
+                audio_output.stop()
+                
+            expected = len("Hello.") * 200 + pad + len("Again.") * 200 + pad
+            played = os.path.getsize(played_path)
+            assert played == expected, f"Expected {expected} bytes played, got {played}"
+    
+    async def test_async_speak_muted(self):
+        """Test that muted async speech doesn't start a worker thread."""
+        from grace.audio.audio_output import AudioOutput
+        
+        audio_output = AudioOutput(self.test_config)
+        
+        try:
+            assert await audio_output.speak_async("This is muted.") is True, \
+                "Muted speak_async should report success like speak"
+            assert await audio_output.speak_async("") is False, \
+                "Muted speak_async should reject empty text like speak"
+            assert audio_output._tts_executor is None, "Muted speech should not create the TTS executor"
+        finally:
+            audio_output.stop()
+    
+    def test_piper_liveness_cache(self):
+        """Test that piper is polled at most every 100 ms and rechecked after release or errors."""
+        from grace.audio.audio_output import AudioOutput
+        
+        class FakeProcess:
+            """Stands in for a running piper process, counting polls."""
+            def __init__(self):
+                self.polls = 0
+            def poll(self):
+                self.polls += 1
+                return None
+            def terminate(self):
+                pass
+            def wait(self, timeout=None):
+                return 0
+        
+        audio_output = AudioOutput(self.test_config)
+        
+        try:
+            process = FakeProcess()
+            audio_output.piper_process = process
+            
+            # Repeated checks within 100 ms share one poll
+            for _ in range(10):
+                assert audio_output._piper_alive(), "Running piper should be alive"
+            assert process.polls == 1, f"Expected 1 poll within 100 ms, got {process.polls}"
+            
+            time.sleep(0.15)
+            assert audio_output._piper_alive(), "Running piper should be alive"
+            assert process.polls == 2, f"Expected a new poll after 100 ms, got {process.polls}"
+            
+            # Releasing piper clears the cache
+            audio_output._cleanup_piper()
+            assert not audio_output._piper_alive(), "Released piper should not be alive"
+            
+            # A failed utterance clears the cache too
+            process = FakeProcess()
+            audio_output.piper_process = process
+            time.sleep(0.15)
+            assert audio_output._piper_alive(), "Running piper should be alive"
+            
+            def fail(text, player):
+                raise RuntimeError("synthesis failed")
+            
+            audio_output.audio_config['mute'] = False
+            audio_output._fallbacks = []
+            audio_output.player_process = FakeProcess()
+            audio_output._stream_piper_output = fail
+            try:
+                assert audio_output.speak("Hello.") is False, "Failed speech without fallbacks should fail"
+            finally:
+                audio_output.audio_config['mute'] = True
+                audio_output.player_process = None
+                
+            polls = process.polls
+            assert audio_output._piper_alive(), "Running piper should be alive"
+            assert process.polls == polls + 1, "Piper should be polled again after a failure"
+        finally:
+            audio_output.stop()
+    
+    async def test_async_speak_after_stop(self):
+        """Test that speak_async works again after stop()."""
+        with tempfile.TemporaryDirectory() as fake_dir:
+            audio_output, _ = self.create_fake_audio_output(fake_dir)
+            
+            try:
+                assert await audio_output.speak_async("Before stopping."), "speak_async should succeed"
+                audio_output.stop()
+                
+                # Used to raise "cannot schedule new futures after shutdown"
+                assert await audio_output.speak_async("After stopping."), \
+                    "speak_async should succeed after stop()"
+            finally:
+                audio_output.stop()
+    
+    def test_stop_during_speech(self):
+        """Test that stop() during an utterance ends it without falling back."""
+        import threading
+        
+        with tempfile.TemporaryDirectory() as fake_dir:
+            audio_output, _ = self.create_fake_audio_output(fake_dir, delay=0.5)
+            
+            fallbacks = []
+            audio_output.speak_fallback = lambda text: fallbacks.append(text) or True
+            
+            results = []
+            speaker = threading.Thread(
+                target=lambda: results.append(audio_output.speak("One. Two. Three. Four."))
+            )
+            speaker.start()
+            
+            try:
+                # Stop while piper is still working through the sentences
+                time.sleep(0.8)
+                audio_output.stop()
+                
+                speaker.join(timeout=5)
+                assert not speaker.is_alive(), "speak should end once stopped"
+                assert results == [False], f"Stopped speech should report failure, got {results}"
+                assert not fallbacks, "Stopped speech should not fall back to another voice"
+                assert audio_output.last_tts_error is None, \
+                    f"Stopping should not record a TTS error, got {audio_output.last_tts_error}"
+            finally:
+                audio_output.stop()
+    
     def tearDown(self):
         """Clean up test resources."""
         if self.test_audio_file and os.path.exists(self.test_audio_file):
@@ -283,9 +692,20 @@ class AudioTest(BaseTest):
             self.test_speech_recognition_initialization()
             self.test_audio_system_initialization()
             self.test_speak_with_fallback()
+            self.test_split_sentences()
+            self.test_progressive_chunks()
+            self.test_piper_line_markers()
+            self.test_persistent_player()
+            self.test_piper_liveness_cache()
+            self.test_stop_during_speech()
+            self.test_find_piper_model()
+            self.test_process_cleanup_batched()
+            self.test_volume_clamping()
             
             # Run async tests
             run_async_tests(self.test_async_speak())
+            run_async_tests(self.test_async_speak_muted())
+            run_async_tests(self.test_async_speak_after_stop())
             
             return self.print_results()
         finally:
@@ -72,9 +72,8 @@ class ResourceTest(BaseTest):
             except Exception:
                 pass
         
-        # Cleanup
-        with audio_output.piper_lock:  # Use lock to avoid race conditions
-            audio_output._cleanup_piper()
+        # Cleanup (takes piper_lock itself)
+        audio_output._cleanup_piper()
         
         # Check if process was cleaned up
         if process_running: